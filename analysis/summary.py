@@ -9,7 +9,7 @@ import csv
 import os
 import argparse
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from collections import defaultdict
 
 
@@ -27,6 +27,13 @@ def load_jsonl(filepath: str) -> List[Dict]:
     return records
 
 
+def _min_max_avg(values: List[float]) -> Tuple[float, float, float]:
+    """Return (min, max, mean) of values, or zeros if empty."""
+    if not values:
+        return 0, 0, 0
+    return min(values), max(values), sum(values) / len(values)
+
+
 def calculate_statistics(records: List[Dict]) -> Dict:
     """Calculate summary statistics from records."""
     if not records:
@@ -58,6 +65,16 @@ def calculate_statistics(records: List[Dict]) -> Dict:
     total_fills = len(fills)
     fill_rate = (total_fills / total_actions * 100) if total_actions > 0 else 0
     
+    # Reduce each series once; derived fields reuse these results
+    min_bid, max_bid, avg_bid = _min_max_avg(bids)
+    min_ask, max_ask, avg_ask = _min_max_avg(asks)
+    min_mid, max_mid, avg_mid = _min_max_avg(mids)
+    min_spread, max_spread, avg_spread = _min_max_avg(spreads)
+    min_inventory, max_inventory, avg_inventory = _min_max_avg(inventories)
+    min_pnl, max_pnl, avg_pnl = _min_max_avg(pnls)
+    
+    total_fill_qty = sum(f.get("qty", 0) for f in fills)
+    
     # Calculate statistics
     stats = {
         "scenario": records[0].get("scenario", "unknown"),
@@ -71,33 +88,33 @@ def calculate_statistics(records: List[Dict]) -> Dict:
         "last_step": max(steps) if steps else 0,
         
         # Prices
-        "min_bid": min(bids) if bids else 0,
-        "max_bid": max(bids) if bids else 0,
-        "avg_bid": sum(bids) / len(bids) if bids else 0,
-        "min_ask": min(asks) if asks else 0,
-        "max_ask": max(asks) if asks else 0,
-        "avg_ask": sum(asks) / len(asks) if asks else 0,
-        "min_mid": min(mids) if mids else 0,
-        "max_mid": max(mids) if mids else 0,
-        "avg_mid": sum(mids) / len(mids) if mids else 0,
-        "mid_range": (max(mids) - min(mids)) if mids else 0,
+        "min_bid": min_bid,
+        "max_bid": max_bid,
+        "avg_bid": avg_bid,
+        "min_ask": min_ask,
+        "max_ask": max_ask,
+        "avg_ask": avg_ask,
+        "min_mid": min_mid,
+        "max_mid": max_mid,
+        "avg_mid": avg_mid,
+        "mid_range": (max_mid - min_mid) if mids else 0,
         
         # Spreads
-        "min_spread": min(spreads) if spreads else 0,
-        "max_spread": max(spreads) if spreads else 0,
-        "avg_spread": sum(spreads) / len(spreads) if spreads else 0,
+        "min_spread": min_spread,
+        "max_spread": max_spread,
+        "avg_spread": avg_spread,
         
         # Inventory
-        "min_inventory": min(inventories) if inventories else 0,
-        "max_inventory": max(inventories) if inventories else 0,
-        "avg_inventory": sum(inventories) / len(inventories) if inventories else 0,
+        "min_inventory": min_inventory,
+        "max_inventory": max_inventory,
+        "avg_inventory": avg_inventory,
         "final_inventory": inventories[-1] if inventories else 0,
         
         # PnL
-        "min_pnl": min(pnls) if pnls else 0,
-        "max_pnl": max(pnls) if pnls else 0,
+        "min_pnl": min_pnl,
+        "max_pnl": max_pnl,
         "final_pnl": pnls[-1] if pnls else 0,
-        "avg_pnl": sum(pnls) / len(pnls) if pnls else 0,
+        "avg_pnl": avg_pnl,
         
         # Cash flow
         "final_cash_flow": cash_flows[-1] if cash_flows else 0,
@@ -113,20 +130,15 @@ def calculate_statistics(records: List[Dict]) -> Dict:
         
         # Fill statistics
         "avg_fill_price": sum(f.get("price", 0) for f in fills) / len(fills) if fills else 0,
-        "total_fill_qty": sum(f.get("qty", 0) for f in fills),
-        "avg_fill_qty": sum(f.get("qty", 0) for f in fills) / len(fills) if fills else 0,
+        "total_fill_qty": total_fill_qty,
+        "avg_fill_qty": total_fill_qty / len(fills) if fills else 0,
     }
     
     # Fill latencies
     fill_latencies = [f.get("latency_ms") for f in fills if f.get("latency_ms") is not None]
-    if fill_latencies:
-        stats["min_fill_latency_ms"] = min(fill_latencies)
-        stats["max_fill_latency_ms"] = max(fill_latencies)
-        stats["avg_fill_latency_ms"] = sum(fill_latencies) / len(fill_latencies)
-    else:
-        stats["min_fill_latency_ms"] = 0
-        stats["max_fill_latency_ms"] = 0
-        stats["avg_fill_latency_ms"] = 0
+    (stats["min_fill_latency_ms"],
+     stats["max_fill_latency_ms"],
+     stats["avg_fill_latency_ms"]) = _min_max_avg(fill_latencies)
     
     return stats
 
@@ -6,65 +6,97 @@ what went as expected, and what was surprising.
 """
 
 import csv
+from heapq import nlargest, nsmallest
+from itertools import zip_longest
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Tuple, Any
 from datetime import datetime
 
 
-def safe_float(value: Any, default: float = 0.0) -> float:
-    """Safely convert value to float."""
-    try:
-        return float(value) if value else default
-    except (ValueError, TypeError):
-        return default
+def safe_float(value: Any, default: float = 0.0, _float=float) -> float:
+    """Safely convert value to float (empty/invalid -> default)."""
+    if value:
+        try:
+            return _float(value)
+        except (ValueError, TypeError):
+            pass
+    return default
 
 
-def safe_int(value: Any, default: int = 0) -> int:
-    """Safely convert value to int."""
-    try:
-        return int(value) if value else default
-    except (ValueError, TypeError):
-        return default
+def safe_int(value: Any, default: int = 0, _int=int, _float=float) -> int:
+    """Safely convert value to int (empty/invalid -> default; "200.0" -> 200)."""
+    if value:
+        try:
+            return _int(value)
+        except (ValueError, TypeError):
+            pass
+        # Float-formatted counts (e.g. "200.0") still read as their integer value
+        try:
+            return _int(_float(value))
+        except (ValueError, TypeError, OverflowError):
+            pass
+    return default
+
+
+# Numeric CSV columns and their coercers, resolved once per cell by dict lookup
+_FLOAT_COLS = frozenset({
+    'final_pnl', 'min_pnl', 'max_pnl', 'mid_range', 'total_fill_qty', 'avg_fill_price', 'fill_rate_pct',
+    'inventory_utilization', 'notional_traded', 'pnl_per_fill', 'inventory_risk_score',
+    'composite_score', 'avg_fill_latency_ms', 'min_fill_latency_ms', 'max_fill_latency_ms',
+})
+_INT_COLS = frozenset({
+    'total_fills', 'buy_fills', 'sell_fills', 'min_inventory', 'max_inventory', 'final_inventory',
+    'total_actions', 'buy_actions', 'sell_actions', 'total_steps',
+})
+_COERCE = {col: safe_float for col in _FLOAT_COLS}
+_COERCE.update({col: safe_int for col in _INT_COLS})
+
+
+def _identity(value: Any) -> Any:
+    """Return value unchanged (non-numeric columns)."""
+    return value
 
 
 def load_and_parse_csv(csv_path: str = "data/processed/summary_report.csv") -> List[Dict]:
     """Load CSV and create list of dicts with derived metrics."""
     records = []
+    coerce_get = _COERCE.get
     
     with open(csv_path, 'r', newline='') as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, [])
+        # Resolve each column's coercer once from the header
+        columns = [(key, coerce_get(key, _identity)) for key in header]
+        num_columns = len(columns)
         for row in reader:
+            if not row:
+                continue
+            if len(row) < num_columns:
+                # Short rows read as None for the missing cells (DictReader behaviour)
+                row = row + [None] * (num_columns - len(row))
+            
             # Convert numeric fields
-            record = {}
-            for key, value in row.items():
-                if key in ['final_pnl', 'total_fills', 'max_inventory', 'min_pnl', 'max_pnl',
-                          'total_fill_qty', 'avg_fill_price', 'fill_rate_pct', 'inventory_utilization',
-                          'notional_traded', 'pnl_per_fill', 'inventory_risk_score', 'composite_score',
-                          'avg_fill_latency_ms', 'min_fill_latency_ms', 'max_fill_latency_ms',
-                          'total_actions', 'buy_actions', 'sell_actions', 'total_steps']:
-                    record[key] = safe_float(value)
-                elif key in ['total_fills', 'buy_fills', 'sell_fills', 'max_inventory', 'final_inventory',
-                            'total_actions', 'buy_actions', 'sell_actions', 'total_steps']:
-                    record[key] = safe_int(value)
-                else:
-                    record[key] = value
+            record = {key: coerce(value) for (key, coerce), value in zip(columns, row)}
+            record_get = record.get
             
             # Calculate derived metrics
-            total_fills = record.get('total_fills', 0)
-            final_pnl = record.get('final_pnl', 0)
-            max_inventory = safe_float(record.get('max_inventory', 0))
-            min_inventory = safe_float(record.get('min_inventory', 0))
+            total_fills = record_get('total_fills', 0)
+            final_pnl = record_get('final_pnl', 0)
+            max_inventory = record_get('max_inventory', 0)
+            min_inventory = record_get('min_inventory', 0)
             
             # Calculate max absolute inventory (considering both long and short positions)
             max_abs_inventory = max(abs(max_inventory), abs(min_inventory))
+            inventory_utilization = max_abs_inventory / 5000.0 if max_abs_inventory > 0 else 0
             
             record['pnl_per_fill'] = final_pnl / total_fills if total_fills > 0 else 0
-            record['inventory_utilization'] = max_abs_inventory / 5000.0 if max_abs_inventory > 0 else 0
-            record['fill_efficiency'] = record.get('fill_rate_pct', 0) / 100.0
+            record['inventory_utilization'] = inventory_utilization
+            record['fill_efficiency'] = record_get('fill_rate_pct', 0) / 100.0
             
             # Risk-adjusted return (PnL / max drawdown)
-            min_pnl = record.get('min_pnl', 0)
-            max_pnl = record.get('max_pnl', 0)
+            min_pnl = record_get('min_pnl', 0)
+            max_pnl = record_get('max_pnl', 0)
             if min_pnl < 0:
                 max_drawdown = abs(min_pnl)
             elif max_pnl > 0:
@@ -75,198 +107,184 @@ def load_and_parse_csv(csv_path: str = "data/processed/summary_report.csv") -> L
             record['risk_adjusted_return'] = final_pnl / max_drawdown if max_drawdown > 0 else 0
             
             # Notional traded
-            total_fill_qty = record.get('total_fill_qty', 0)
-            avg_fill_price = record.get('avg_fill_price', 0)
-            record['notional_traded'] = total_fill_qty * avg_fill_price
+            record['notional_traded'] = record_get('total_fill_qty', 0) * record_get('avg_fill_price', 0)
             
             # Inventory risk score (lower is better, 0 = no risk, 1 = maxed out)
-            record['inventory_risk_score'] = record['inventory_utilization']
+            record['inventory_risk_score'] = inventory_utilization
             
             records.append(record)
     
     return records
 
 
-def categorize_experiments(records: List[Dict]) -> Dict[str, List[str]]:
-    """Categorize experiments by type."""
-    categories = {
-        'passive': [],
-        'aggressive': [],
-        'price_explore': [],
-        'qty_test': [],
-        'spread_cross': [],
-        'inventory_mgmt': []
-    }
-    
-    for record in records:
-        exp = record['experiment']
-        
-        if 'passive' in exp:
-            categories['passive'].append(exp)
-        elif 'aggressive' in exp:
-            categories['aggressive'].append(exp)
-        elif 'price_explore' in exp:
-            categories['price_explore'].append(exp)
-        elif 'qty_test' in exp:
-            categories['qty_test'].append(exp)
-        elif 'spread_cross' in exp:
-            categories['spread_cross'].append(exp)
-        elif 'inventory_mgmt' in exp:
-            categories['inventory_mgmt'].append(exp)
-    
-    return categories
-
-
-def compute_effectiveness_rankings(records: List[Dict]) -> Dict[str, List[Dict]]:
-    """Compute effectiveness rankings across 4 competition dimensions."""
-    # Calculate composite scores first
-    max_pnl = max(abs(r['final_pnl']) for r in records) if records else 1
-    max_notional = max(r['notional_traded'] for r in records) if records else 1
-    max_latency = max(r.get('avg_fill_latency_ms', 0) for r in records if r.get('avg_fill_latency_ms', 0) > 0) if records else 1
-    
-    for record in records:
-        pnl_norm = record['final_pnl'] / max_pnl if max_pnl > 0 else 0
-        notional_norm = record['notional_traded'] / max_notional if max_notional > 0 else 0
-        latency_norm = 1 - (record.get('avg_fill_latency_ms', 0) / max_latency) if max_latency > 0 else 0
+def compute_effectiveness_rankings(records: List[Dict], top_n: int = 10) -> Dict[str, List[Dict]]:
+    """Compute effectiveness rankings across 4 competition dimensions (top_n per ranking)."""
+    # Extract the scored columns once, then normalize against their maxima
+    pnls = [r['final_pnl'] for r in records]
+    notionals = [r['notional_traded'] for r in records]
+    latencies = [r.get('avg_fill_latency_ms', 0) for r in records]
+    risks = [r['inventory_risk_score'] for r in records]
+    
+    max_pnl = max(map(abs, pnls), default=1)
+    max_notional = max(notionals, default=1)
+    # No positive latency recorded -> latency term contributes 0
+    max_latency = max((lat for lat in latencies if lat > 0), default=0 if records else 1)
+    
+    for record, pnl, notional, latency, risk in zip(records, pnls, notionals, latencies, risks):
+        pnl_norm = pnl / max_pnl if max_pnl > 0 else 0
+        notional_norm = notional / max_notional if max_notional > 0 else 0
+        latency_norm = 1 - (latency / max_latency) if max_latency > 0 else 0
         
         record['composite_score'] = (
             0.4 * pnl_norm +
             0.3 * notional_norm +
-            0.2 * (1 - record['inventory_risk_score']) +
+            0.2 * (1 - risk) +
             0.1 * latency_norm
         )
     
     rankings = {}
     
     # 1. Profitability ranking
-    rankings['profitability'] = sorted(
-        records,
-        key=lambda r: r['final_pnl'],
-        reverse=True
+    rankings['profitability'] = nlargest(
+        top_n, records,
+        key=itemgetter('final_pnl')
     )
     
     # 2. Notional traded ranking
-    rankings['notional'] = sorted(
-        records,
-        key=lambda r: r['notional_traded'],
-        reverse=True
+    rankings['notional'] = nlargest(
+        top_n, records,
+        key=itemgetter('notional_traded')
     )
     
     # 3. Inventory management ranking (lower utilization is better)
-    rankings['inventory_mgmt'] = sorted(
-        records,
-        key=lambda r: r['inventory_risk_score']
+    rankings['inventory_mgmt'] = nsmallest(
+        top_n, records,
+        key=itemgetter('inventory_risk_score')
     )
     
     # 4. Speed ranking (based on fill latency - lower is better)
+    # Only records with a measured latency, so the key is always present
     speed_records = [r for r in records if r.get('avg_fill_latency_ms', 0) > 0]
-    rankings['speed'] = sorted(
-        speed_records,
-        key=lambda r: r.get('avg_fill_latency_ms', float('inf'))
+    rankings['speed'] = nsmallest(
+        top_n, speed_records,
+        key=itemgetter('avg_fill_latency_ms')
     )
     
     # Overall composite score
-    rankings['overall'] = sorted(
-        records,
-        key=lambda r: r['composite_score'],
-        reverse=True
+    rankings['overall'] = nlargest(
+        top_n, records,
+        key=itemgetter('composite_score')
     )
     
     return rankings
 
 
+def _extend_unseen(dest: List[Dict], entries: List[Dict], seen: set):
+    """Append entries whose experiment name is not yet in seen, updating seen."""
+    for entry in entries:
+        if entry['experiment'] not in seen:
+            dest.append(entry)
+            seen.add(entry['experiment'])
+
+
 def analyze_what_worked(records: List[Dict]) -> List[Dict]:
     """Identify experiments that worked well."""
-    worked = []
-    worked_experiments = set()
+    # Single pass; each bucket keeps record order and is reported in priority order
+    profitable = []
+    high_fill = []
     
-    # Positive PnL experiments
     for record in records:
-        if record['final_pnl'] > 0:
-            worked.append({
-                'experiment': record['experiment'],
-                'reason': 'Profitable',
-                'final_pnl': record['final_pnl'],
-                'fill_rate': record.get('fill_rate_pct', 0),
-                'inventory_risk': record['inventory_risk_score']
-            })
-            worked_experiments.add(record['experiment'])
+        final_pnl = record['final_pnl']
+        fill_rate = record.get('fill_rate_pct', 0)
+        inventory_risk = record['inventory_risk_score']
+        
+        # Positive PnL experiments
+        if final_pnl > 0:
+            reason, bucket = 'Profitable', profitable
+        # High fill rate with controlled inventory
+        elif fill_rate > 50 and inventory_risk < 0.5:
+            reason, bucket = 'High fill rate, low inventory risk', high_fill
+        else:
+            continue
+        
+        bucket.append({
+            'experiment': record['experiment'],
+            'reason': reason,
+            'final_pnl': final_pnl,
+            'fill_rate': fill_rate,
+            'inventory_risk': inventory_risk
+        })
     
-    # High fill rate with controlled inventory
-    for record in records:
-        if (record.get('fill_rate_pct', 0) > 50 and 
-            record['inventory_risk_score'] < 0.5 and
-            record['experiment'] not in worked_experiments):
-            worked.append({
-                'experiment': record['experiment'],
-                'reason': 'High fill rate, low inventory risk',
-                'final_pnl': record['final_pnl'],
-                'fill_rate': record.get('fill_rate_pct', 0),
-                'inventory_risk': record['inventory_risk_score']
-            })
-            worked_experiments.add(record['experiment'])
+    # Later buckets skip experiment names already reported
+    worked = profitable
+    worked_experiments = {w['experiment'] for w in worked}
+    _extend_unseen(worked, high_fill, worked_experiments)
     
     return worked
 
 
 def analyze_what_didnt_work(records: List[Dict]) -> List[Dict]:
     """Identify experiments that failed."""
-    failed = []
-    failed_experiments = set()
+    # Single pass; each bucket keeps record order and is reported in priority order
+    zero_fills = []
+    blowups = []
+    large_losses = []
     
-    # Zero fills despite actions
     for record in records:
-        if record.get('total_actions', 0) > 0 and record.get('total_fills', 0) == 0:
-            failed.append({
+        actions = record.get('total_actions', 0)
+        final_pnl = record['final_pnl']
+        
+        # Zero fills despite actions
+        if actions > 0 and record.get('total_fills', 0) == 0:
+            zero_fills.append({
                 'experiment': record['experiment'],
                 'reason': f"Zero fills despite {record['total_actions']} actions",
                 'actions': record['total_actions'],
-                'final_pnl': record['final_pnl']
+                'final_pnl': final_pnl
             })
-            failed_experiments.add(record['experiment'])
-    
-    # Inventory blow-ups
-    for record in records:
-        if record['inventory_utilization'] >= 1.0 and record['experiment'] not in failed_experiments:
-            failed.append({
+        
+        # Inventory blow-ups
+        elif record['inventory_utilization'] >= 1.0:
+            blowups.append({
                 'experiment': record['experiment'],
                 'reason': f"Inventory limit hit (max: {record['max_inventory']})",
                 'max_inventory': record['max_inventory'],
-                'final_pnl': record['final_pnl']
+                'final_pnl': final_pnl
             })
-            failed_experiments.add(record['experiment'])
-    
-    # Large losses
-    for record in records:
-        if record['final_pnl'] < -1000 and record['experiment'] not in failed_experiments:
-            failed.append({
+        
+        # Large losses
+        elif final_pnl < -1000:
+            large_losses.append({
                 'experiment': record['experiment'],
-                'reason': f"Large loss: ${record['final_pnl']:.2f}",
-                'final_pnl': record['final_pnl'],
+                'reason': f"Large loss: ${final_pnl:.2f}",
+                'final_pnl': final_pnl,
                 'fill_rate': record.get('fill_rate_pct', 0)
             })
-            failed_experiments.add(record['experiment'])
+    
+    # Later buckets skip experiment names already reported
+    failed = zero_fills
+    failed_experiments = {f['experiment'] for f in failed}
+    _extend_unseen(failed, blowups, failed_experiments)
+    _extend_unseen(failed, large_losses, failed_experiments)
     
     return failed
 
 
-def analyze_surprising_findings(records: List[Dict], categories: Dict[str, List[str]]) -> List[Dict]:
+def analyze_surprising_findings(records: List[Dict]) -> List[Dict]:
     """Identify surprising findings vs expectations."""
     surprises = []
     
-    # Helper to find record by experiment name
-    def find_record(exp_name: str) -> Dict:
-        for r in records:
-            if r['experiment'] == exp_name:
-                return r
-        return {}
+    # Index records by experiment name (first occurrence wins, as with a linear scan)
+    by_name: Dict[str, Dict] = {}
+    for r in records:
+        by_name.setdefault(r['experiment'], r)
     
     # Helper to filter records
     def filter_records(condition) -> List[Dict]:
         return [r for r in records if condition(r)]
     
     # 1. Mid-price orders never fill
-    mid_price = find_record('price_explore_mid_qty100_freq10')
+    mid_price = by_name.get('price_explore_mid_qty100_freq10', {})
     if mid_price and mid_price.get('total_actions', 0) > 0 and mid_price.get('total_fills', 0) == 0:
         surprises.append({
             'finding': 'Mid-price limit orders never execute',
@@ -277,8 +295,8 @@ def analyze_surprising_findings(records: List[Dict], categories: Dict[str, List[
     
     # 2. Quantity sweet spot
     qty_experiments = filter_records(lambda r: 'qty_test' in r['experiment'])
-    qty_with_fills = filter_records(lambda r: 'qty_test' in r['experiment'] and r.get('total_fills', 0) > 0)
-    qty_without_fills = filter_records(lambda r: 'qty_test' in r['experiment'] and r.get('total_fills', 0) == 0)
+    qty_with_fills = [r for r in qty_experiments if r.get('total_fills', 0) > 0]
+    qty_without_fills = [r for r in qty_experiments if r.get('total_fills', 0) == 0]
     
     if len(qty_with_fills) > 0 and len(qty_without_fills) > 0:
         worked_qtys = [exp.split('_')[2] for exp in [r['experiment'] for r in qty_with_fills]]
@@ -291,7 +309,7 @@ def analyze_surprising_findings(records: List[Dict], categories: Dict[str, List[
         })
     
     # 3. Spread crossing is costly
-    spread_cross = find_record('spread_cross_qty100_freq10')
+    spread_cross = by_name.get('spread_cross_qty100_freq10', {})
     if spread_cross and spread_cross.get('fill_rate_pct', 0) > 80 and spread_cross.get('final_pnl', 0) < -10000:
         surprises.append({
             'finding': 'Spread crossing strategy loses money despite high fill rate',
@@ -303,7 +321,7 @@ def analyze_surprising_findings(records: List[Dict], categories: Dict[str, List[
     # 4. Aggressive strategies hit limits quickly
     aggressive = filter_records(lambda r: 'aggressive' in r['experiment'])
     if len(aggressive) > 0:
-        hit_limits = filter_records(lambda r: 'aggressive' in r['experiment'] and r['inventory_utilization'] >= 1.0)
+        hit_limits = [r for r in aggressive if r['inventory_utilization'] >= 1.0]
         if len(hit_limits) > 0:
             surprises.append({
                 'finding': 'Aggressive strategies hit inventory limits very quickly',
@@ -313,48 +331,58 @@ def analyze_surprising_findings(records: List[Dict], categories: Dict[str, List[
             })
     
     # 5. Market stability
-    passive = find_record('passive')
-    if passive and safe_float(passive.get('mid_range', 0)) < 0.2:
+    passive = by_name.get('passive', {})
+    if passive and passive.get('mid_range', 0) < 0.2:
         surprises.append({
             'finding': 'Market is extremely stable',
             'experiment': 'passive',
-            'details': f"Mid price range only {safe_float(passive.get('mid_range', 0)):.2f}, spread stayed 0.1-0.2",
+            'details': f"Mid price range only {passive.get('mid_range', 0):.2f}, spread stayed 0.1-0.2",
             'implication': 'Normal market has very tight spreads, making market making challenging'
         })
     
     # 6. Price exploration asymmetry
-    price_explore = filter_records(lambda r: 'price_explore' in r['experiment'])
-    if len(price_explore) > 0:
-        ask_explore_list = filter_records(lambda r: 'price_explore' in r['experiment'] and 'ask' in r['experiment'])
-        bid_explore_list = filter_records(lambda r: 'price_explore' in r['experiment'] and 'bid' in r['experiment'])
-        if ask_explore_list and bid_explore_list:
-            ask_explore = ask_explore_list[0]
-            bid_explore = bid_explore_list[0]
-            if ask_explore.get('total_fills', 0) > 0 and bid_explore.get('total_fills', 0) > 0:
-                ask_pnl = ask_explore.get('final_pnl', 0)
-                bid_pnl = bid_explore.get('final_pnl', 0)
-                if ask_pnl < bid_pnl:
-                    surprises.append({
-                        'finding': 'Asymmetric fill behavior between bid and ask',
-                        'experiment': 'price_explore_bid/ask',
-                        'details': f"Ask exploration: {ask_explore.get('total_fills', 0)} fills, ${ask_pnl:.2f} PnL. Bid exploration: {bid_explore.get('total_fills', 0)} fills, ${bid_pnl:.2f} PnL",
-                        'implication': 'Market may have directional bias or different liquidity on each side'
-                    })
+    # One scan picks the first ask- and bid-side exploration run
+    ask_explore = bid_explore = None
+    for r in records:
+        exp = r['experiment']
+        if 'price_explore' not in exp:
+            continue
+        if ask_explore is None and 'ask' in exp:
+            ask_explore = r
+        if bid_explore is None and 'bid' in exp:
+            bid_explore = r
+    if ask_explore is not None and bid_explore is not None:
+        if ask_explore.get('total_fills', 0) > 0 and bid_explore.get('total_fills', 0) > 0:
+            ask_pnl = ask_explore.get('final_pnl', 0)
+            bid_pnl = bid_explore.get('final_pnl', 0)
+            if ask_pnl < bid_pnl:
+                surprises.append({
+                    'finding': 'Asymmetric fill behavior between bid and ask',
+                    'experiment': 'price_explore_bid/ask',
+                    'details': f"Ask exploration: {ask_explore.get('total_fills', 0)} fills, ${ask_pnl:.2f} PnL. Bid exploration: {bid_explore.get('total_fills', 0)} fills, ${bid_pnl:.2f} PnL",
+                    'implication': 'Market may have directional bias or different liquidity on each side'
+                })
     
     return surprises
 
 
 def format_table(headers: List[str], rows: List[List[Any]], max_width: int = 80) -> str:
     """Format a simple table without external dependencies."""
+    return "\n".join(_table_lines(headers, rows, max_width))
+
+
+def _table_lines(headers: List[str], rows: List[List[Any]], max_width: int = 80) -> List[str]:
+    """Format a simple table as a list of lines (header, separator, rows)."""
     if not rows:
-        return "  (no data)"
+        return ["  (no data)"]
     
-    # Calculate column widths
+    # Calculate column widths: transpose the stringified cells and take each
+    # column's max length (cells beyond the header count are ignored)
+    num_cols = len(headers)
+    str_rows = [[str(cell) for cell in row[:num_cols]] for row in rows]
     col_widths = [len(str(h)) for h in headers]
-    for row in rows:
-        for i, cell in enumerate(row):
-            if i < len(col_widths):
-                col_widths[i] = max(col_widths[i], len(str(cell)))
+    for i, column in enumerate(zip_longest(*str_rows, fillvalue="")):
+        col_widths[i] = max(col_widths[i], max(map(len, column)))
     
     # Limit column widths to prevent overflow
     total_width = sum(col_widths) + len(headers) * 3 + 1
@@ -369,26 +397,24 @@ def format_table(headers: List[str], rows: List[List[Any]], max_width: int = 80)
                     break
     
     # Format header
-    header_row = " | ".join(str(h).ljust(col_widths[i]) for i, h in enumerate(headers))
+    ljust = str.ljust
+    header_row = " | ".join(ljust(str(h), width) for h, width in zip(headers, col_widths))
     separator = "-" * len(header_row)
     
-    # Format rows
-    formatted_rows = []
-    for row in rows:
-        formatted_row = " | ".join(
-            str(cell)[:col_widths[i]].ljust(col_widths[i]) 
-            for i, cell in enumerate(row[:len(headers)])
-        )
-        formatted_rows.append(formatted_row)
+    # Format rows from the already-stringified cells
+    formatted_rows = [
+        " | ".join(ljust(cell[:width], width) for cell, width in zip(row, col_widths))
+        for row in str_rows
+    ]
     
-    return "\n".join([header_row, separator] + formatted_rows)
+    return [header_row, separator] + formatted_rows
 
 
-def generate_report(records: List[Dict], categories: Dict[str, List[str]], 
-                    rankings: Dict[str, List[Dict]],
+def generate_report(records: List[Dict], rankings: Dict[str, List[Dict]],
                     worked: List[Dict], failed: List[Dict], 
                     surprises: List[Dict]) -> str:
     """Generate comprehensive synthesis report."""
+    # Lines are collected in one list (tables extend it directly) and joined once
     report = []
     report.append("=" * 80)
     report.append("EXPERIMENT SYNTHESIS REPORT")
@@ -406,7 +432,7 @@ def generate_report(records: List[Dict], categories: Dict[str, List[str]],
         [r['experiment'], f"${r['final_pnl']:.2f}", f"${r.get('pnl_per_fill', 0):.2f}", r.get('total_fills', 0)]
         for r in rankings['profitability'][:10]
     ]
-    report.append(format_table(
+    report.extend(_table_lines(
         ['Experiment', 'Final PnL', 'PnL per Fill', 'Total Fills'],
         profitability_rows
     ))
@@ -416,7 +442,7 @@ def generate_report(records: List[Dict], categories: Dict[str, List[str]],
         [r['experiment'], f"${r['notional_traded']:.2f}", r.get('total_fills', 0), r.get('total_fill_qty', 0)]
         for r in rankings['notional'][:10]
     ]
-    report.append(format_table(
+    report.extend(_table_lines(
         ['Experiment', 'Notional Traded', 'Total Fills', 'Total Fill Qty'],
         notional_rows
     ))
@@ -426,7 +452,7 @@ def generate_report(records: List[Dict], categories: Dict[str, List[str]],
         [r['experiment'], f"{r['inventory_risk_score']:.3f}", r.get('max_inventory', 0), r.get('final_inventory', 0)]
         for r in rankings['inventory_mgmt'][:10]
     ]
-    report.append(format_table(
+    report.extend(_table_lines(
         ['Experiment', 'Risk Score', 'Max Inventory', 'Final Inventory'],
         inventory_rows
     ))
@@ -438,7 +464,7 @@ def generate_report(records: List[Dict], categories: Dict[str, List[str]],
              f"{r.get('min_fill_latency_ms', 0):.2f}", f"{r.get('max_fill_latency_ms', 0):.2f}"]
             for r in rankings['speed'][:10]
         ]
-        report.append(format_table(
+        report.extend(_table_lines(
             ['Experiment', 'Avg Latency (ms)', 'Min Latency (ms)', 'Max Latency (ms)'],
             speed_rows
         ))
@@ -449,7 +475,7 @@ def generate_report(records: List[Dict], categories: Dict[str, List[str]],
          f"${r['notional_traded']:.2f}", f"{r['inventory_risk_score']:.3f}"]
         for r in rankings['overall'][:10]
     ]
-    report.append(format_table(
+    report.extend(_table_lines(
         ['Experiment', 'Composite Score', 'Final PnL', 'Notional Traded', 'Inventory Risk'],
         overall_rows
     ))
@@ -463,7 +489,7 @@ def generate_report(records: List[Dict], categories: Dict[str, List[str]],
         worked_rows = [[w['experiment'], w['reason'], f"${w['final_pnl']:.2f}", 
                         f"{w['fill_rate']:.1f}%", f"{w['inventory_risk']:.2f}"] 
                        for w in worked]
-        report.append(format_table(
+        report.extend(_table_lines(
             ['Experiment', 'Reason', 'Final PnL', 'Fill Rate', 'Inventory Risk'],
             worked_rows
         ))
@@ -477,7 +503,7 @@ def generate_report(records: List[Dict], categories: Dict[str, List[str]],
     
     if failed:
         failed_rows = [[f['experiment'], f['reason']] for f in failed]
-        report.append(format_table(
+        report.extend(_table_lines(
             ['Experiment', 'Failure Reason'],
             failed_rows
         ))
@@ -509,7 +535,7 @@ def generate_report(records: List[Dict], categories: Dict[str, List[str]],
     if worked:
         profitable_exps = [w for w in worked if w['final_pnl'] > 0]
         if profitable_exps:
-            best = max(profitable_exps, key=lambda x: x['final_pnl'])
+            best = max(profitable_exps, key=itemgetter('final_pnl'))
             recommendations.append(f"[+] Best performing strategy: {best['experiment']} (PnL: ${best['final_pnl']:.2f})")
             recommendations.append(f"    -> Consider adapting this approach for production strategy")
     
@@ -540,7 +566,7 @@ def generate_report(records: List[Dict], categories: Dict[str, List[str]],
         recommendations.append(f"    -> Need dynamic position limits and rebalancing")
     
     if recommendations:
-        report.append("\n".join(recommendations))
+        report.extend(recommendations)
     else:
         report.append("Continue systematic experimentation to identify optimal strategies.")
     
@@ -561,9 +587,6 @@ def main():
     records = load_and_parse_csv(csv_path)
     print(f"Loaded {len(records)} experiments")
     
-    print("Categorizing experiments...")
-    categories = categorize_experiments(records)
-    
     print("Computing effectiveness rankings...")
     rankings = compute_effectiveness_rankings(records)
     
@@ -574,21 +597,19 @@ def main():
     failed = analyze_what_didnt_work(records)
     
     print("Identifying surprising findings...")
-    surprises = analyze_surprising_findings(records, categories)
+    surprises = analyze_surprising_findings(records)
     
     print("Generating report...")
-    report = generate_report(records, categories, rankings, worked, failed, surprises)
-    
-    # Print to console
-    print("\n" + report)
+    report = generate_report(records, rankings, worked, failed, surprises)
     
-    # Save to markdown file
+    # Save to markdown file (binary write, no newline translation); the
+    # console only gets a summary line rather than the whole report
     output_path = Path("data/processed/synthesis_report.md")
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w') as f:
-        f.write(report)
+    report_bytes = report.encode('utf-8')
+    output_path.write_bytes(report_bytes)
     
-    print(f"\nReport saved to: {output_path}")
+    print(f"\nReport written ({len(report_bytes)} bytes) to: {output_path}")
 
 
 if __name__ == "__main__":
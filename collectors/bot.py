@@ -4,10 +4,9 @@ Data Collector Bot
 Extended TradingBot with data logging and pluggable experiment strategies.
 """
 
-import json
 import time
 from typing import Dict, Optional
-from student_algorithm import TradingBot
+from student_algorithm import TradingBot, json_loads
 from collectors.logger import DataLogger
 from collectors.strategies import ExperimentStrategy
 
@@ -64,39 +63,37 @@ class DataCollectorBot(TradingBot):
     def _on_market_data(self, ws, message: str):
         """Handle incoming market data snapshot with logging."""
         try:
-            recv_time = time.time()
-            data = json.loads(message)
+            recv_ns = time.monotonic_ns()
+            data = json_loads(message)
             
             # Skip connection confirmation messages
             if data.get("type") == "CONNECTED":
                 return
             
             # Measure step latency
-            if self.last_done_time is not None:
-                step_latency = (recv_time - self.last_done_time) * 1000  # ms
-                self.step_latencies.append(step_latency)
-            
-            # Extract market data
-            self.current_step = data.get("step", 0)
-            self.last_bid = data.get("bid", 0.0)
-            self.last_ask = data.get("ask", 0.0)
-            
-            # Capture full order book if available
-            # Handle both "MARKET_DATA" and "SNAPSHOT" message types
-            if data.get("type") in ["MARKET_DATA", "SNAPSHOT"] or "bids" in data:
-                self.last_bids = data.get("bids", [])
-                self.last_asks = data.get("asks", [])
-            else:
-                # If full book not available, create minimal book from best bid/ask
-                self.last_bids = [{"price": self.last_bid, "qty": 0}] if self.last_bid > 0 else []
-                self.last_asks = [{"price": self.last_ask, "qty": 0}] if self.last_ask > 0 else []
+            if self.last_done_ns is not None:
+                self._record_step_latency(recv_ns - self.last_done_ns)
+            
+            # Extract market data (snapshots always carry these; partial
+            # messages fall back to defaults)
+            try:
+                self.current_step = data["step"]
+                self.last_bid = data["bid"]
+                self.last_ask = data["ask"]
+            except KeyError:
+                self.current_step = data.get("step", 0)
+                self.last_bid = data.get("bid", 0.0)
+                self.last_ask = data.get("ask", 0.0)
+            
+            # Capture full order book and its depth
+            self._capture_book(data)
             
             self.last_trade = data.get("last_trade", 0.0)
             
             # Log progress every 500 steps
             if self.current_step % 500 == 0 and self.step_latencies:
-                avg_lat = sum(self.step_latencies[-100:]) / min(len(self.step_latencies), 100)
-                print(f"[{self.student_id}] Step {self.current_step} | Orders: {self.orders_sent} | Inv: {self.inventory} | Avg Latency: {avg_lat:.1f}ms")
+                avg_lat = self._step_latency_window_sum / len(self.step_latencies) / 1e6
+                self._log_async(f"[{self.student_id}] Step {self.current_step} | Orders: {self.orders_sent} | Inv: {self.inventory} | Avg Latency: {avg_lat:.1f}ms")
             
             # Calculate mid price
             if self.last_bid > 0 and self.last_ask > 0:
@@ -131,6 +128,8 @@ class DataCollectorBot(TradingBot):
                     mid=self.last_mid,
                     bids=self.last_bids,
                     asks=self.last_asks,
+                    bid_depth=self.last_bid_depth,
+                    ask_depth=self.last_ask_depth,
                     last_trade=self.last_trade,
                     inventory=self.inventory,
                     cash_flow=self.cash_flow,
@@ -151,56 +150,41 @@ class DataCollectorBot(TradingBot):
         except Exception as e:
             print(f"[{self.student_id}] Market data error: {e}")
     
-    def _on_order_response(self, ws, message: str):
-        """Handle order responses and fills with logging."""
-        try:
-            recv_time = time.time()
-            data = json.loads(message)
-            msg_type = data.get("type")
-            
-            if msg_type == "AUTHENTICATED":
-                print(f"[{self.student_id}] Authenticated - ready to trade!")
-            
-            elif msg_type == "FILL":
-                qty = data.get("qty", 0)
-                price = data.get("price", 0)
-                side = data.get("side", "")
-                order_id = data.get("order_id", "")
-                
-                # Measure fill latency
-                fill_latency = None
-                if order_id in self.order_send_times:
-                    fill_latency = (recv_time - self.order_send_times[order_id]) * 1000  # ms
-                    self.fill_latencies.append(fill_latency)
-                    del self.order_send_times[order_id]
-                
-                # Update inventory and cash flow
-                if side == "BUY":
-                    self.inventory += qty
-                    self.cash_flow -= qty * price
-                else:
-                    self.inventory -= qty
-                    self.cash_flow += qty * price
-                
-                # Calculate mark-to-market PnL
-                self.pnl = self.cash_flow + self.inventory * self.last_mid
-                
-                # Store fill for next log entry
-                self.pending_fill = {
-                    "side": side,
-                    "price": price,
-                    "qty": qty,
-                    "order_id": order_id,
-                    "latency_ms": fill_latency
-                }
-                
-                print(f"[{self.student_id}] FILL: {side} {qty} @ {price:.2f} | Inventory: {self.inventory} | PnL: {self.pnl:.2f}")
-            
-            elif msg_type == "ERROR":
-                print(f"[{self.student_id}] ERROR: {data.get('message')}")
-                
-        except Exception as e:
-            print(f"[{self.student_id}] Order response error: {e}")
+    def _handle_fill(self, data: Dict, recv_ns: int):
+        """Apply a fill and keep it (with its latency) for the next log entry."""
+        qty = data.get("qty", 0)
+        price = data.get("price", 0)
+        side = data.get("side", "")
+        order_id = data.get("order_id", "")
+        
+        # Measure fill latency
+        fill_latency = None
+        sent_ns = self.order_send_times.pop(order_id, None)
+        if sent_ns is not None:
+            fill_latency = (recv_ns - sent_ns) / 1e6  # ms
+            self._record_fill_latency(fill_latency)
+        
+        # Update inventory and cash flow
+        if side == "BUY":
+            self.inventory += qty
+            self.cash_flow -= qty * price
+        else:
+            self.inventory -= qty
+            self.cash_flow += qty * price
+        
+        # Calculate mark-to-market PnL
+        self.pnl = self.cash_flow + self.inventory * self.last_mid
+        
+        # Store fill for next log entry
+        self.pending_fill = {
+            "side": side,
+            "price": price,
+            "qty": qty,
+            "order_id": order_id,
+            "latency_ms": fill_latency
+        }
+        
+        self._log_async(f"[{self.student_id}] FILL: {side} {qty} @ {price:.2f} | Inventory: {self.inventory} | PnL: {self.pnl:.2f}", block=True)
     
     def run(self):
         """Main entry point - register, connect, and run."""
@@ -208,7 +192,8 @@ class DataCollectorBot(TradingBot):
         if not self.register():
             raise ConnectionError(f"Failed to register with server at {self.host}. Check that the server is running and --host/--secure flags are correct.")
         
-        # Step 2: Connect
+        # Step 2: Connect (output printer first: callbacks start queueing lines)
+        self._log_thread.start()
         if not self.connect():
             raise ConnectionError(f"Failed to connect to WebSocket at {self.host}")
         
@@ -226,6 +211,9 @@ class DataCollectorBot(TradingBot):
             if self.order_ws:
                 self.order_ws.close()
             
+            # Flush queued output before the final summary
+            self._flush_log()
+            
             # Close logger
             if self.logger:
                 self.logger.close()
@@ -236,17 +224,19 @@ class DataCollectorBot(TradingBot):
             print(f"  Inventory: {self.inventory}")
             print(f"  PnL: {self.pnl:.2f}")
             print(f"  Data logged to: {self.logger.get_filepath() if self.logger else 'N/A'}")
+            if self._log_dropped:
+                print(f"  Output lines dropped: {self._log_dropped}")
             
             # Print latency statistics
-            if self.step_latencies:
+            if self._step_latency_count:
                 print(f"\n  Step Latency (ms):")
-                print(f"    Min: {min(self.step_latencies):.1f}")
-                print(f"    Max: {max(self.step_latencies):.1f}")
-                print(f"    Avg: {sum(self.step_latencies)/len(self.step_latencies):.1f}")
+                print(f"    Min: {self._step_latency_min / 1e6:.1f}")
+                print(f"    Max: {self._step_latency_max / 1e6:.1f}")
+                print(f"    Avg: {self._step_latency_total / self._step_latency_count / 1e6:.1f}")
             
-            if self.fill_latencies:
+            if self._fill_latency_count:
                 print(f"\n  Fill Latency (ms):")
-                print(f"    Min: {min(self.fill_latencies):.1f}")
-                print(f"    Max: {max(self.fill_latencies):.1f}")
-                print(f"    Avg: {sum(self.fill_latencies)/len(self.fill_latencies):.1f}")
+                print(f"    Min: {self._fill_latency_min:.1f}")
+                print(f"    Max: {self._fill_latency_max:.1f}")
+                print(f"    Avg: {self._fill_latency_total / self._fill_latency_count:.1f}")
 
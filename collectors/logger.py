@@ -57,7 +57,9 @@ class DataLogger:
                  pnl: float,
                  orders_sent: int,
                  action: Optional[Dict] = None,
-                 fill: Optional[Dict] = None):
+                 fill: Optional[Dict] = None,
+                 bid_depth: Optional[int] = None,
+                 ask_depth: Optional[int] = None):
         """
         Log a single simulation step.
         
@@ -75,13 +77,17 @@ class DataLogger:
             orders_sent: Total orders sent so far
             action: Order submitted this step (None if none)
             fill: Fill received this step (None if none)
+            bid_depth: Total bid quantity, if already computed by the caller
+            ask_depth: Total ask quantity, if already computed by the caller
         """
         # Calculate spread
         spread = round(ask - bid, 4) if bid > 0 and ask > 0 else 0
         
-        # Calculate book depth (sum of quantities)
-        bid_depth = sum(b.get("qty", 0) for b in bids) if bids else 0
-        ask_depth = sum(a.get("qty", 0) for a in asks) if asks else 0
+        # Calculate book depth (sum of quantities) unless the caller supplied it
+        if bid_depth is None:
+            bid_depth = sum(b.get("qty", 0) for b in bids) if bids else 0
+        if ask_depth is None:
+            ask_depth = sum(a.get("qty", 0) for a in asks) if asks else 0
         
         record = {
             "step": step,
@@ -2,17 +2,25 @@
 Trading Strategies Package
 ===========================
 Modular trading strategies with regime classification.
+
+Public names are imported lazily on first access (PEP 562), so importing
+one submodule does not load every strategy.
 """
 
-from strategies.metrics import IncrementalMetrics
-from strategies.classifier import RegimeClassifier
-from strategies.base import BaseStrategy
-from strategies.mean_reversion import MeanReversionStrategy
-from strategies.momentum import MomentumStrategy
-from strategies.passive_mm import PassiveMarketMaker
-from strategies.aggressive_mm import AggressiveMarketMaker
-from strategies.crash_survival import CrashSurvivalStrategy
-from strategies.router import StrategyRouter
+import importlib
+
+# Public name -> defining submodule
+_LAZY = {
+    "IncrementalMetrics": "strategies.metrics",
+    "RegimeClassifier": "strategies.classifier",
+    "BaseStrategy": "strategies.base",
+    "MeanReversionStrategy": "strategies.mean_reversion",
+    "MomentumStrategy": "strategies.momentum",
+    "PassiveMarketMaker": "strategies.passive_mm",
+    "AggressiveMarketMaker": "strategies.aggressive_mm",
+    "CrashSurvivalStrategy": "strategies.crash_survival",
+    "StrategyRouter": "strategies.router",
+}
 
 __all__ = [
     "IncrementalMetrics",
@@ -25,3 +33,19 @@ __all__ = [
     "CrashSurvivalStrategy",
     "StrategyRouter",
 ]
+
+
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access and cache it."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List lazily exported names alongside loaded ones."""
+    return sorted(set(globals()) | set(__all__))
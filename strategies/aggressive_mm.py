@@ -16,6 +16,8 @@ class AggressiveMarketMaker(BaseStrategy):
     Crosses the spread to guarantee fills, trades frequently for high notional.
     """
     
+    __slots__ = ('max_inventory', 'qty', 'trade_freq')
+    
     def __init__(self, max_inventory: int = 3500, qty: int = 200, trade_freq: int = 10):
         """
         Initialize aggressive market maker.
@@ -42,7 +44,8 @@ class AggressiveMarketMaker(BaseStrategy):
             return {"side": "BUY", "price": round(ask, 2), "qty": 300}
         
         # Trade at specified frequency
-        if step % self.trade_freq != 0:
+        trade_freq = self.trade_freq
+        if step % trade_freq:
             return None
         
         tick = 0.1
@@ -58,24 +61,19 @@ class AggressiveMarketMaker(BaseStrategy):
         skew = -0.0002 * inventory
         skew = max(-0.2, min(0.2, skew))
         
-        # Bias toward reducing position
+        # Bias toward reducing position, otherwise alternate sides
         if inventory > 1000:
+            sell = True
+        elif inventory < -1000:
+            sell = False
+        else:
+            sell = (step // trade_freq) & 1  # odd trade cycle
+
+        if sell:
             raw = sell_base + skew
             price = min(ask, max(bid + tick, raw))
             return {"side": "SELL", "price": round(price, 1), "qty": self.qty}
-        elif inventory < -1000:
-            raw = buy_base + skew
-            price = max(bid, min(ask - tick, raw))
-            price = max(tick, price)
-            return {"side": "BUY", "price": round(price, 1), "qty": self.qty}
-        else:
-            # Alternate sides
-            if (step // self.trade_freq) % 2 == 0:
-                raw = buy_base + skew
-                price = max(bid, min(ask - tick, raw))
-                price = max(tick, price)
-                return {"side": "BUY", "price": round(price, 1), "qty": self.qty}
-            else:
-                raw = sell_base + skew
-                price = min(ask, max(bid + tick, raw))
-                return {"side": "SELL", "price": round(price, 1), "qty": self.qty}
+        raw = buy_base + skew
+        price = max(bid, min(ask - tick, raw))
+        price = max(tick, price)
+        return {"side": "BUY", "price": round(price, 1), "qty": self.qty}
@@ -28,6 +28,8 @@ class BaseStrategy(ABC):
     Abstract base class for all trading strategies.
     """
     
+    __slots__ = ('name',)
+    
     def __init__(self, name: str):
         """
         Initialize strategy.
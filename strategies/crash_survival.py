@@ -16,6 +16,8 @@ class CrashSurvivalStrategy(BaseStrategy):
     Only action: flatten positions aggressively. Never adds new positions.
     """
     
+    __slots__ = ('flatten_threshold', 'qty')
+    
     def __init__(self, flatten_threshold: int = 200, qty: int = 500):
         """
         Initialize crash survival strategy.
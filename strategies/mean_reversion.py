@@ -17,6 +17,8 @@ class MeanReversionStrategy(BaseStrategy):
     exits when price returns to mean.
     """
     
+    __slots__ = ('entry_z', 'exit_z', 'max_inventory', 'qty')
+    
     def __init__(self, entry_z: float = 1.5, exit_z: float = 0.5, 
                  max_inventory: int = 2500, qty: int = 200):
         """
@@ -4,7 +4,6 @@ Incremental Metrics Calculator
 Efficiently calculate market metrics using O(1) incremental updates.
 """
 
-from collections import deque
 from typing import Optional
 
 
@@ -14,23 +13,37 @@ class IncrementalMetrics:
     All operations are O(1) after initialization.
     """
     
+    # Updated on every tick; slots avoid a per-instance __dict__
+    __slots__ = (
+        "window_size", "calibration_steps",
+        "mid_history", "spread_history", "depth_history",
+        "_write_idx", "_count",
+        "mid_sum", "spread_sum", "depth_sum", "mid_sq_sum",
+        "baseline_spread", "baseline_depth", "baseline_mid", "calibrated",
+        "spread_ratio", "depth_ratio", "price_velocity", "volatility",
+        "imbalance", "z_score", "churn_rate",
+        "_last_mid", "_mid_changes", "_churn_window",
+    )
+    
     def __init__(self, window_size: int = 100, calibration_steps: int = 100):
         self.window_size = window_size
         self.calibration_steps = calibration_steps
         
-        # Rolling windows (fixed-size deques)
-        self.mid_history = deque(maxlen=window_size)
-        self.spread_history = deque(maxlen=window_size)
-        self.depth_history = deque(maxlen=window_size)
+        # Rolling windows (preallocated ring buffers)
+        self.mid_history = [0.0] * window_size
+        self.spread_history = [0.0] * window_size
+        self.depth_history = [0.0] * window_size
+        self._write_idx = 0  # Slot the next sample is written to
+        self._count = 0      # Number of valid samples in the buffers
         
         # Running sums for O(1) mean calculation
         self.mid_sum = 0.0
         self.spread_sum = 0.0
         self.depth_sum = 0.0
         
-        # Running sum of squares for O(1) std calculation
+        # Running sum of squares for O(1) std calculation (mid only; it is
+        # the only series whose dispersion feeds a metric)
         self.mid_sq_sum = 0.0
-        self.spread_sq_sum = 0.0
         
         # Baseline values (set during calibration)
         self.baseline_spread: Optional[float] = None
@@ -66,46 +79,46 @@ class IncrementalMetrics:
         
         # --- Incremental sum updates ---
         
-        # If window is full, subtract the oldest value before adding new
-        if len(self.mid_history) == self.window_size:
-            old_mid = self.mid_history[0]
-            old_spread = self.spread_history[0]
-            old_depth = self.depth_history[0]
+        idx = self._write_idx
+        
+        # If window is full, the slot about to be overwritten holds the oldest value
+        if self._count == self.window_size:
+            old_mid = self.mid_history[idx]
+            old_spread = self.spread_history[idx]
+            old_depth = self.depth_history[idx]
             
             self.mid_sum -= old_mid
             self.mid_sq_sum -= old_mid * old_mid
             self.spread_sum -= old_spread
-            self.spread_sq_sum -= old_spread * old_spread
             self.depth_sum -= old_depth
         
         # Add new values
         self.mid_sum += mid
         self.mid_sq_sum += mid * mid
         self.spread_sum += spread
-        self.spread_sq_sum += spread * spread
         self.depth_sum += total_depth
         
-        # Append to history (deque handles maxlen automatically)
-        self.mid_history.append(mid)
-        self.spread_history.append(spread)
-        self.depth_history.append(total_depth)
+        # Write into the ring buffers, overwriting the oldest slot
+        self.mid_history[idx] = mid
+        self.spread_history[idx] = spread
+        self.depth_history[idx] = total_depth
+        
+        idx += 1
+        self._write_idx = 0 if idx == self.window_size else idx
+        if self._count < self.window_size:
+            self._count += 1
         
         # --- Calculate derived metrics ---
-        n = len(self.mid_history)
-        if n == 0:
-            return
+        n = self._count
         
-        # Current averages
+        # Current average (spread/depth averages are only needed for calibration)
         avg_mid = self.mid_sum / n
-        avg_spread = self.spread_sum / n
-        avg_depth = self.depth_sum / n
         
         # Variance using: Var(X) = E[X²] - E[X]²
         mid_variance = (self.mid_sq_sum / n) - (avg_mid * avg_mid)
-        spread_variance = (self.spread_sq_sum / n) - (avg_spread * avg_spread)
         
         # Standard deviation (with safety check for negative variance due to float errors)
-        self.volatility = (max(0, mid_variance)) ** 0.5
+        self.volatility = mid_variance ** 0.5 if mid_variance > 0.0 else 0.0
         
         # Z-score for mean reversion
         if self.volatility > 0.001:
@@ -115,7 +128,9 @@ class IncrementalMetrics:
         
         # Price velocity (10-step momentum)
         if n >= 10:
-            self.price_velocity = (mid - self.mid_history[-10]) / 10
+            # idx is one past the current sample, so this is the sample from 9
+            # updates back, as the old history[-10] was (negative index wraps)
+            self.price_velocity = (mid - self.mid_history[idx - 10]) / 10
         else:
             self.price_velocity = 0.0
         
@@ -132,23 +147,25 @@ class IncrementalMetrics:
         
         # Compute churn as fraction of steps with mid changes over window
         if n >= self._churn_window:
-            self.churn_rate = min(1.0, self._mid_changes / self._churn_window)
+            churn = self._mid_changes / self._churn_window
+            self.churn_rate = churn if churn < 1.0 else 1.0
             if n % self._churn_window == 0:
                 self._mid_changes = 0
         else:
             self.churn_rate = 0.0
         
         # --- Set baseline after calibration period ---
-        if not self.calibrated and n >= self.calibration_steps:
-            self.baseline_spread = avg_spread
-            self.baseline_depth = avg_depth
+        if not self.calibrated:
+            if n < self.calibration_steps:
+                # Still calibrating: ratios stay neutral
+                self.spread_ratio = 1.0
+                self.depth_ratio = 1.0
+                return
+            self.baseline_spread = self.spread_sum / n
+            self.baseline_depth = self.depth_sum / n
             self.baseline_mid = avg_mid
             self.calibrated = True
         
         # --- Calculate ratios (only after calibration) ---
-        if self.calibrated:
-            self.spread_ratio = spread / self.baseline_spread if self.baseline_spread > 0 else 1.0
-            self.depth_ratio = total_depth / self.baseline_depth if self.baseline_depth > 0 else 1.0
-        else:
-            self.spread_ratio = 1.0
-            self.depth_ratio = 1.0
+        self.spread_ratio = spread / self.baseline_spread if self.baseline_spread > 0 else 1.0
+        self.depth_ratio = total_depth / self.baseline_depth if self.baseline_depth > 0 else 1.0
@@ -17,6 +17,8 @@ class MomentumStrategy(BaseStrategy):
     expecting the trend to continue.
     """
     
+    __slots__ = ('velocity_threshold', 'max_inventory', 'qty', 'trade_freq')
+    
     def __init__(self, velocity_threshold: float = 0.05, max_inventory: int = 2000,
                  qty: int = 200, trade_freq: int = 20):
         """
@@ -16,6 +16,8 @@ class PassiveMarketMaker(BaseStrategy):
     Quotes at mid price with inventory skew to maintain balanced position.
     """
     
+    __slots__ = ('skew_factor', 'max_inventory', 'qty', 'trade_freq')
+    
     def __init__(self, skew_factor: float = 0.0002, max_inventory: int = 3000,
                  qty: int = 200, trade_freq: int = 15):
         """
@@ -39,7 +41,8 @@ class PassiveMarketMaker(BaseStrategy):
         Generate order based on passive market making logic.
         """
         # Trade only at specified frequency
-        if step % self.trade_freq != 0:
+        trade_freq = self.trade_freq
+        if step % trade_freq:
             return None
         
         # Don't exceed inventory limits
@@ -58,7 +61,7 @@ class PassiveMarketMaker(BaseStrategy):
         skew = -self.skew_factor * inventory
         skew = max(-0.2, min(0.2, skew))
 
-        if (step // self.trade_freq) % 2 == 0:
+        if not (step // trade_freq) & 1:  # even trade cycle
             # BUY: join/improve bid, never cross ask
             raw = buy_base + skew
             price = max(bid, min(ask - tick, raw))
@@ -4,6 +4,7 @@ Strategy Router
 Routes to appropriate strategy based on market regime.
 """
 
+import logging
 from typing import Dict, Optional
 from strategies.metrics import IncrementalMetrics
 from strategies.classifier import RegimeClassifier
@@ -14,6 +15,8 @@ from strategies.passive_mm import PassiveMarketMaker
 from strategies.aggressive_mm import AggressiveMarketMaker
 from strategies.crash_survival import CrashSurvivalStrategy
 
+logger = logging.getLogger(__name__)
+
 
 class StrategyRouter:
     """
@@ -37,6 +40,26 @@ class StrategyRouter:
             "aggressive_mm": AggressiveMarketMaker(qty=200, trade_freq=2),
             "crash_survival": CrashSurvivalStrategy(),
         }
+        
+        # Resolve per-tick strategy lookups once instead of hashing names every step
+        self._mean_reversion = self.strategies["mean_reversion"]
+        self._passive_mm_normal = self.strategies["passive_mm_normal"]
+        self._passive_mm_hft = self.strategies["passive_mm_hft"]
+        self._aggressive_mm = self.strategies["aggressive_mm"]
+        self._crash_survival = self.strategies["crash_survival"]
+        
+        # Regime -> strategy for the fixed routes (NORMAL picks per tick,
+        # CALIBRATING is absent so it never trades)
+        self._regime_strategies = {
+            # CRASH: Survival mode - only flatten
+            RegimeClassifier.CRASH: self._crash_survival,
+            # RECOVERY: Conservative approach
+            RegimeClassifier.RECOVERY: self._passive_mm_normal,
+            # STRESSED: Conservative with wider spreads
+            RegimeClassifier.STRESSED: self._passive_mm_normal,
+            # HFT: Careful, small sizes
+            RegimeClassifier.HFT: self._passive_mm_hft,
+        }
     
     def decide_order(self, bid: float, ask: float, mid: float, inventory: int,
                      step: int, bid_depth: int, ask_depth: int) -> Dict:
@@ -67,56 +90,27 @@ class StrategyRouter:
         # 2. Classify regime
         regime = self.classifier.classify(self.metrics)
         
-        # Log regime changes (optional, can be removed for production)
-        if regime != self.classifier.previous_regime:
-            print(f"[Step {step}] REGIME CHANGE: {self.classifier.previous_regime} → {regime}")
+        # Log regime changes at DEBUG level (no formatting or stdout write otherwise)
+        if regime != self.classifier.previous_regime and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[Step %d] REGIME CHANGE: %s → %s", step, self.classifier.previous_regime, regime)
         
         # 3. Route to appropriate strategy
-        order = None
+        if regime == RegimeClassifier.NORMAL:
+            # NORMAL: Strong mean reversion signal takes priority,
+            # otherwise default to aggressive market making
+            if abs(self.metrics.z_score) > 1.5:
+                strategy = self._mean_reversion
+            else:
+                strategy = self._aggressive_mm
+        else:
+            strategy = self._regime_strategies.get(regime)
         
-        if regime == RegimeClassifier.CALIBRATING:
+        if strategy is not None:
+            order = strategy.get_order(bid, ask, mid, inventory, step, self.metrics)
+        else:
             # Don't trade during calibration
             order = None
         
-        elif regime == RegimeClassifier.CRASH:
-            # CRASH: Survival mode - only flatten
-            order = self.strategies["crash_survival"].get_order(
-                bid, ask, mid, inventory, step, self.metrics
-            )
-        
-        elif regime == RegimeClassifier.RECOVERY:
-            # RECOVERY: Conservative approach
-            order = self.strategies["passive_mm_normal"].get_order(
-                bid, ask, mid, inventory, step, self.metrics
-            )
-        
-        elif regime == RegimeClassifier.STRESSED:
-            # STRESSED: Conservative with wider spreads
-            order = self.strategies["passive_mm_normal"].get_order(
-                bid, ask, mid, inventory, step, self.metrics
-            )
-        
-        elif regime == RegimeClassifier.HFT:
-            # HFT: Careful, small sizes
-            order = self.strategies["passive_mm_hft"].get_order(
-                bid, ask, mid, inventory, step, self.metrics
-            )
-        
-        elif regime == RegimeClassifier.NORMAL:
-            # NORMAL: Check if mean reversion opportunity exists
-            z_score = self.metrics.z_score
-            
-            # Strong mean reversion signal takes priority
-            if abs(z_score) > 1.5:
-                order = self.strategies["mean_reversion"].get_order(
-                    bid, ask, mid, inventory, step, self.metrics
-                )
-            else:
-                # Default to aggressive market making
-                order = self.strategies["aggressive_mm"].get_order(
-                    bid, ask, mid, inventory, step, self.metrics
-                )
-        
         # 4. Apply risk management overlay
         order = self._apply_risk_management(order, bid, ask, inventory)
         
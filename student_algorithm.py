@@ -10,15 +10,36 @@ YOUR TASK:
 """
 
 import json
-import websocket
+import queue
 import threading
 import argparse
 import time
-import requests
+import socket
 import ssl
+from collections import deque
+from heapq import merge
+from itertools import islice
+import websocket
+import requests
 import urllib3
 from typing import Dict, Optional
 
+# Fast JSON codec for the websocket hot paths: orjson when installed, stdlib
+# json otherwise. json_dumps returns UTF-8 bytes either way; websocket-client
+# sends bytes as-is in a text frame.
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+    
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# The DONE frame never changes: serialize it once
+_DONE_MSG = json_dumps({"action": "DONE"})
+
 # Suppress SSL warnings for self-signed certificates
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -29,6 +50,17 @@ from strategies.router import StrategyRouter
 from collectors.logger import DataLogger
 
 
+class OpenOrder:
+    """Price, quantity and submission step of one resting order."""
+    
+    __slots__ = ("price", "qty", "step")
+    
+    def __init__(self, price: float, qty: int, step: int):
+        self.price = price
+        self.qty = qty
+        self.step = step
+
+
 class TradingBot:
     """
     A trading bot that connects to the exchange simulator.
@@ -51,6 +83,12 @@ class TradingBot:
         self.token = None
         self.run_id = None
         
+        # Pooled HTTP session for registration. With --secure the server uses a
+        # self-signed cert, so verification is off exactly as for the WSS sockets
+        # (sslopt CERT_NONE); plain HTTP has nothing to verify.
+        self._http = requests.Session()
+        self._http.verify = not secure
+        
         # Trading state - track your position
         self.inventory = 0      # Current position (positive = long, negative = short)
         self.cash_flow = 0.0    # Cumulative cash from trades (negative when buying)
@@ -66,6 +104,8 @@ class TradingBot:
         # Store full order book data
         self.last_bids = []
         self.last_asks = []
+        self.last_bid_depth = 0
+        self.last_ask_depth = 0
         
         # Strategy router
         self.router = StrategyRouter()
@@ -76,17 +116,37 @@ class TradingBot:
         self.running = True
         
         # Latency measurement
-        self.last_done_time = None          # When we sent DONE
-        self.step_latencies = []            # Time between DONE and next market data
-        self.order_send_times = {}          # order_id -> time sent
-        self.fill_latencies = []            # Time between order and fill
+        self.last_done_ns = None            # When we sent DONE (monotonic ns)
+        self.step_latencies = deque(maxlen=100)  # Recent DONE -> next market data times (ns)
+        self._step_latency_window_sum = 0   # Sum of step_latencies
+        self._step_latency_total = 0        # Whole-run step latency stats (ns)
+        self._step_latency_count = 0
+        self._step_latency_min = 0
+        self._step_latency_max = 0
+        self.order_send_times = {}          # order_id -> time sent (monotonic ns)
+        self.fill_latencies = deque(maxlen=10000)  # Recent order -> fill times (ms)
+        self._fill_latency_total = 0.0      # Whole-run fill latency stats (ms)
+        self._fill_latency_count = 0
+        self._fill_latency_min = 0.0
+        self._fill_latency_max = 0.0
         
         # Open order tracking (for cancel-opposite-side logic)
-        self.open_buy_orders = {}           # order_id -> {"price": X, "qty": N, "step": S}
-        self.open_sell_orders = {}          # order_id -> {"price": X, "qty": N, "step": S}
+        self.open_buy_orders = {}           # order_id -> OpenOrder
+        self.open_sell_orders = {}          # order_id -> OpenOrder
         
         # Order limits
         self.MAX_OPEN_ORDERS = 40           # Stay well under the 50 limit
+        self.MAX_TRACKED_SEND_TIMES = 2000  # Cap on order_send_times (oldest evicted first)
+        
+        # Outbound order message, reused by _send_order (wire field order)
+        self._order_msg = {"order_id": "", "side": "", "price": 0.0, "qty": 0}
+        
+        # Order-stream message type -> handler(data, recv_ns)
+        self._order_handlers = {
+            "AUTHENTICATED": self._handle_authenticated,
+            "FILL": self._handle_fill,
+            "ERROR": self._handle_error,
+        }
         
         # Current regime (for regime-aware order management)
         self.current_regime = "CALIBRATING"
@@ -94,6 +154,12 @@ class TradingBot:
         # Data logger (initialized after registration)
         self.logger = None
         self.pending_fill = None            # Track fill for next log entry
+        
+        # Progress and fill lines are queued and printed by a daemon thread so a
+        # slow terminal/pipe never stalls the websocket callbacks (started in run)
+        self._log_q = queue.Queue(maxsize=256)
+        self._log_dropped = 0               # Lines lost to a full queue or failed print
+        self._log_thread = threading.Thread(target=self._log_drain, daemon=True)
     
     # =========================================================================
     # REGISTRATION - Get a token to start trading
@@ -107,12 +173,7 @@ class TradingBot:
             headers = {"Authorization": f"Bearer {self.student_id}"}
             if self.password:
                 headers["X-Team-Password"] = self.password
-            resp = requests.get(
-                url,
-                headers=headers,
-                timeout=10,
-                verify=not self.secure  # Disable SSL verification for self-signed certs
-            )
+            resp = self._http.get(url, headers=headers, timeout=10)
             
             if resp.status_code != 200:
                 print(f"[{self.student_id}] Registration FAILED: {resp.text}")
@@ -152,6 +213,9 @@ class TradingBot:
             # SSL options for self-signed certificates
             sslopt = {"cert_reqs": ssl.CERT_NONE} if self.secure else None
             
+            # Disable Nagle so small order/DONE frames go out immediately
+            sockopt = ((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),)
+            
             # Market Data WebSocket
             market_url = f"{self.ws_proto}://{self.host}/api/ws/market?run_id={self.run_id}"
             self.market_ws = websocket.WebSocketApp(
@@ -174,12 +238,12 @@ class TradingBot:
             
             # Start WebSocket threads
             threading.Thread(
-                target=lambda: self.market_ws.run_forever(sslopt=sslopt),
+                target=lambda: self.market_ws.run_forever(sslopt=sslopt, sockopt=sockopt),
                 daemon=True
             ).start()
             
             threading.Thread(
-                target=lambda: self.order_ws.run_forever(sslopt=sslopt),
+                target=lambda: self.order_ws.run_forever(sslopt=sslopt, sockopt=sockopt),
                 daemon=True
             ).start()
             
@@ -198,37 +262,36 @@ class TradingBot:
     def _on_market_data(self, ws, message: str):
         """Handle incoming market data snapshot."""
         try:
-            recv_time = time.time()
-            data = json.loads(message)
+            recv_ns = time.monotonic_ns()
+            data = json_loads(message)
             
             # Skip connection confirmation messages
             if data.get("type") == "CONNECTED":
                 return
             
             # Measure step latency (time since we sent DONE)
-            if self.last_done_time is not None:
-                step_latency = (recv_time - self.last_done_time) * 1000  # ms
-                self.step_latencies.append(step_latency)
-            
-            # Extract market data
-            self.current_step = data.get("step", 0)
-            self.last_bid = data.get("bid", 0.0)
-            self.last_ask = data.get("ask", 0.0)
-            
-            # Capture full order book if available
-            if data.get("type") in ["MARKET_DATA", "SNAPSHOT"] or "bids" in data:
-                self.last_bids = data.get("bids", [])
-                self.last_asks = data.get("asks", [])
-            else:
-                # If full book not available, create minimal book from best bid/ask
-                self.last_bids = [{"price": self.last_bid, "qty": 0}] if self.last_bid > 0 else []
-                self.last_asks = [{"price": self.last_ask, "qty": 0}] if self.last_ask > 0 else []
+            if self.last_done_ns is not None:
+                self._record_step_latency(recv_ns - self.last_done_ns)
+            
+            # Extract market data (snapshots always carry these; partial
+            # messages fall back to defaults)
+            try:
+                self.current_step = data["step"]
+                self.last_bid = data["bid"]
+                self.last_ask = data["ask"]
+            except KeyError:
+                self.current_step = data.get("step", 0)
+                self.last_bid = data.get("bid", 0.0)
+                self.last_ask = data.get("ask", 0.0)
+            
+            # Capture full order book and its depth
+            self._capture_book(data)
             
             # Log progress every 500 steps with latency stats
             if self.current_step % 500 == 0 and self.step_latencies:
-                print(f"[{self.student_id}] Step {self.current_step} | bid: {self.last_bid} | ask: {self.last_ask} | mid: {self.last_mid}")
-                avg_lat = sum(self.step_latencies[-100:]) / min(len(self.step_latencies), 100)
-                print(f"[{self.student_id}] Step {self.current_step} | Orders: {self.orders_sent} | Inv: {self.inventory} | Avg Latency: {avg_lat:.1f}ms")
+                self._log_async(f"[{self.student_id}] Step {self.current_step} | bid: {self.last_bid} | ask: {self.last_ask} | mid: {self.last_mid}")
+                avg_lat = self._step_latency_window_sum / len(self.step_latencies) / 1e6
+                self._log_async(f"[{self.student_id}] Step {self.current_step} | Orders: {self.orders_sent} | Inv: {self.inventory} | Avg Latency: {avg_lat:.1f}ms")
             
             # Calculate mid price
             if self.last_bid > 0 and self.last_ask > 0:
@@ -274,6 +337,8 @@ class TradingBot:
                     mid=self.last_mid,
                     bids=self.last_bids,
                     asks=self.last_asks,
+                    bid_depth=self.last_bid_depth,
+                    ask_depth=self.last_ask_depth,
                     last_trade=0.0,  # Not tracked in base TradingBot
                     inventory=self.inventory,
                     cash_flow=self.cash_flow,
@@ -295,6 +360,52 @@ class TradingBot:
         except Exception as e:
             print(f"[{self.student_id}] Market data error: {e}")
     
+    def _record_step_latency(self, latency_ns: int):
+        """Add a step latency sample to the recent window and the whole-run stats."""
+        window = self.step_latencies
+        if len(window) == window.maxlen:
+            self._step_latency_window_sum -= window[0]
+        window.append(latency_ns)
+        self._step_latency_window_sum += latency_ns
+        
+        if self._step_latency_count == 0:
+            self._step_latency_min = self._step_latency_max = latency_ns
+        elif latency_ns < self._step_latency_min:
+            self._step_latency_min = latency_ns
+        elif latency_ns > self._step_latency_max:
+            self._step_latency_max = latency_ns
+        self._step_latency_total += latency_ns
+        self._step_latency_count += 1
+    
+    def _record_fill_latency(self, latency_ms: float):
+        """Add a fill latency sample to the bounded buffer and the whole-run stats."""
+        self.fill_latencies.append(latency_ms)
+        
+        if self._fill_latency_count == 0:
+            self._fill_latency_min = self._fill_latency_max = latency_ms
+        elif latency_ms < self._fill_latency_min:
+            self._fill_latency_min = latency_ms
+        elif latency_ms > self._fill_latency_max:
+            self._fill_latency_max = latency_ms
+        self._fill_latency_total += latency_ms
+        self._fill_latency_count += 1
+    
+    def _capture_book(self, data: Dict):
+        """Store the order book from a market data message and sum its depth once."""
+        if data.get("type") in ("MARKET_DATA", "SNAPSHOT") or "bids" in data:
+            bids = self.last_bids = data.get("bids", [])
+            asks = self.last_asks = data.get("asks", [])
+            # Sum each side only if it has levels
+            self.last_bid_depth = sum(b.get("qty", 0) for b in bids) if bids else 0
+            self.last_ask_depth = sum(a.get("qty", 0) for a in asks) if asks else 0
+        else:
+            # If full book not available, create minimal book from best bid/ask
+            # (placeholder levels carry no quantity, so depth is 0 without a scan)
+            self.last_bids = [{"price": self.last_bid, "qty": 0}] if self.last_bid > 0 else []
+            self.last_asks = [{"price": self.last_ask, "qty": 0}] if self.last_ask > 0 else []
+            self.last_bid_depth = 0
+            self.last_ask_depth = 0
+    
     # =========================================================================
     # YOUR STRATEGY - MODIFY THIS METHOD!
     # =========================================================================
@@ -324,9 +435,9 @@ class TradingBot:
         if mid <= 0 or bid <= 0 or ask <= 0:
             return {"order": None, "regime": self.current_regime}
         
-        # Calculate book depth
-        bid_depth = sum(b.get("qty", 0) for b in self.last_bids) if self.last_bids else 1000
-        ask_depth = sum(a.get("qty", 0) for a in self.last_asks) if self.last_asks else 1000
+        # Book depth (summed once per tick in _capture_book)
+        bid_depth = self.last_bid_depth if self.last_bids else 1000
+        ask_depth = self.last_ask_depth if self.last_asks else 1000
         
         # Delegate to strategy router
         return self.router.decide_order(
@@ -349,8 +460,10 @@ class TradingBot:
             "action": "CANCEL",
             "order_id": order_id
         }
+        # A cancelled order no longer needs its send time for fill latency
+        self.order_send_times.pop(order_id, None)
         try:
-            self.order_ws.send(json.dumps(msg))
+            self.order_ws.send(json_dumps(msg))
         except Exception as e:
             print(f"[{self.student_id}] Cancel order error: {e}")
 
@@ -377,14 +490,14 @@ class TradingBot:
             # Buying at/above an existing sell would cross our own sell
             to_cancel = [
                 oid for oid, meta in self.open_sell_orders.items()
-                if meta.get("price", float("inf")) <= new_price
+                if meta.price <= new_price
             ]
             self._cancel_order_ids(to_cancel)
         else:
             # Selling at/below an existing buy would cross our own buy
             to_cancel = [
                 oid for oid, meta in self.open_buy_orders.items()
-                if meta.get("price", float("-inf")) >= new_price
+                if meta.price >= new_price
             ]
             self._cancel_order_ids(to_cancel)
 
@@ -394,123 +507,175 @@ class TradingBot:
 
     def _cancel_old_orders(self, count: int):
         """Cancel the oldest N orders (by step they were submitted)."""
-        # Gather all orders with their step
-        all_orders = []
-        for oid, meta in self.open_buy_orders.items():
-            all_orders.append((oid, meta.get("step", 0), "BUY"))
-        for oid, meta in self.open_sell_orders.items():
-            all_orders.append((oid, meta.get("step", 0), "SELL"))
-        
-        # Sort by step (oldest first)
-        all_orders.sort(key=lambda x: x[1])
-        
-        # Cancel the oldest N
-        for i in range(min(count, len(all_orders))):
-            oid, _, side = all_orders[i]
-            self._cancel_order(oid)
-            if side == "BUY":
-                self.open_buy_orders.pop(oid, None)
-            else:
-                self.open_sell_orders.pop(oid, None)
+        # Each book is already in step order: merge them lazily and take the
+        # first N (on equal steps BUY orders come first, as with a stable sort)
+        oldest = islice(
+            merge(self.open_buy_orders.items(), self.open_sell_orders.items(),
+                  key=lambda item: item[1].step),
+            count
+        )
+        self._cancel_order_ids([oid for oid, _ in oldest])
 
     def _cancel_stale_orders(self, max_age: int = 200):
         """Cancel orders older than max_age steps."""
-        stale_buy = [
-            oid for oid, meta in self.open_buy_orders.items()
-            if self.current_step - meta.get("step", 0) > max_age
-        ]
-        stale_sell = [
-            oid for oid, meta in self.open_sell_orders.items()
-            if self.current_step - meta.get("step", 0) > max_age
-        ]
-        self._cancel_order_ids(stale_buy + stale_sell)
+        # Each book is in submission (step) order, so its stale orders form a
+        # prefix: stop at the first order that is still fresh
+        cutoff = self.current_step - max_age
+        stale = []
+        for book in (self.open_buy_orders, self.open_sell_orders):
+            for oid, meta in book.items():
+                if meta.step >= cutoff:
+                    break
+                stale.append(oid)
+        self._cancel_order_ids(stale)
     
     def _send_order(self, order: Dict):
         """Send an order to the exchange."""
         order_id = f"ORD_{self.student_id}_{self.current_step}_{self.orders_sent}"
+        side = order["side"]
+        price = order["price"]
+        qty = order["qty"]
         
-        msg = {
-            "order_id": order_id,
-            "side": order["side"],
-            "price": order["price"],
-            "qty": order["qty"]
-        }
+        # Fill the reusable message in place; it is serialized before returning
+        msg = self._order_msg
+        msg["order_id"] = order_id
+        msg["side"] = side
+        msg["price"] = price
+        msg["qty"] = qty
         
+        send_times = self.order_send_times
         try:
-            self.order_send_times[order_id] = time.time()  # Track send time
-            self.order_ws.send(json.dumps(msg))
+            send_times[order_id] = time.monotonic_ns()  # Track send time
+            self.order_ws.send(json_dumps(msg))
             self.orders_sent += 1
             
             # Track the open order with step for age tracking
-            if order["side"] == "BUY":
-                self.open_buy_orders[order_id] = {"price": order["price"], "qty": order["qty"], "step": self.current_step}
-            else:
-                self.open_sell_orders[order_id] = {"price": order["price"], "qty": order["qty"], "step": self.current_step}
+            book = self.open_buy_orders if side == "BUY" else self.open_sell_orders
+            book[order_id] = OpenOrder(price, qty, self.current_step)
                 
         except Exception as e:
             print(f"[{self.student_id}] Send order error: {e}")
+        
+        # Cap the latency table only after the order is out. Fills pop entries
+        # on the order-ws thread, so trimming here may race and must not fail
+        if len(send_times) > self.MAX_TRACKED_SEND_TIMES:
+            try:
+                # Dicts keep insertion order: drop the oldest unfilled order
+                send_times.pop(next(iter(send_times), None), None)
+            except RuntimeError:
+                pass  # resized by a concurrent fill; trimmed on the next send
     
     def _send_done(self):
         """Signal DONE to advance to the next simulation step."""
         try:
-            self.order_ws.send(json.dumps({"action": "DONE"}))
-            self.last_done_time = time.time()  # Track when we sent DONE
+            self.order_ws.send(_DONE_MSG)
+            self.last_done_ns = time.monotonic_ns()  # Track when we sent DONE
         except:
             pass
     
     def _on_order_response(self, ws, message: str):
         """Handle order responses and fills."""
         try:
-            recv_time = time.time()
-            data = json.loads(message)
-            msg_type = data.get("type")
-            
-            if msg_type == "AUTHENTICATED":
-                print(f"[{self.student_id}] Authenticated - ready to trade!")
-            
-            elif msg_type == "FILL":
-                qty = data.get("qty", 0)
-                price = data.get("price", 0)
-                side = data.get("side", "")
-                order_id = data.get("order_id", "")
-                
-                # Measure fill latency
-                if order_id in self.order_send_times:
-                    fill_latency = (recv_time - self.order_send_times[order_id]) * 1000  # ms
-                    self.fill_latencies.append(fill_latency)
-                    del self.order_send_times[order_id]
-                
-                # Remove from open order tracking
-                self.open_buy_orders.pop(order_id, None)
-                self.open_sell_orders.pop(order_id, None)
-                
-                # Update inventory and cash flow
-                if side == "BUY":
-                    self.inventory += qty
-                    self.cash_flow -= qty * price  # Spent cash to buy
-                else:
-                    self.inventory -= qty
-                    self.cash_flow += qty * price  # Received cash from selling
-                
-                # Calculate mark-to-market PnL using mid price
-                self.pnl = self.cash_flow + self.inventory * self.last_mid
-                
-                # Store fill for next log entry
-                self.pending_fill = {
-                    "side": side,
-                    "price": price,
-                    "qty": qty,
-                    "order_id": order_id
-                }
-                
-                print(f"[{self.student_id}] FILL: {side} {qty} @ {price:.2f} | Inventory: {self.inventory} | PnL: {self.pnl:.2f}")
-            
-            elif msg_type == "ERROR":
-                print(f"[{self.student_id}] ERROR: {data.get('message')}")
+            recv_ns = time.monotonic_ns()
+            data = json_loads(message)
+            handler = self._order_handlers.get(data.get("type"))
+            if handler is not None:
+                handler(data, recv_ns)
                 
         except Exception as e:
             print(f"[{self.student_id}] Order response error: {e}")
     
+    def _handle_authenticated(self, data: Dict, recv_ns: int):
+        """Order stream is authenticated."""
+        print(f"[{self.student_id}] Authenticated - ready to trade!")
+    
+    def _handle_fill(self, data: Dict, recv_ns: int):
+        """Apply a fill to inventory and PnL."""
+        qty = data.get("qty", 0)
+        price = data.get("price", 0)
+        side = data.get("side", "")
+        order_id = data.get("order_id", "")
+        
+        # Measure fill latency
+        sent_ns = self.order_send_times.pop(order_id, None)
+        if sent_ns is not None:
+            fill_latency = (recv_ns - sent_ns) / 1e6  # ms
+            self._record_fill_latency(fill_latency)
+        
+        # Remove from open order tracking
+        self.open_buy_orders.pop(order_id, None)
+        self.open_sell_orders.pop(order_id, None)
+        
+        # Update inventory and cash flow
+        if side == "BUY":
+            self.inventory += qty
+            self.cash_flow -= qty * price  # Spent cash to buy
+        else:
+            self.inventory -= qty
+            self.cash_flow += qty * price  # Received cash from selling
+        
+        # Calculate mark-to-market PnL using mid price
+        self.pnl = self.cash_flow + self.inventory * self.last_mid
+        
+        # Store fill for next log entry
+        self.pending_fill = {
+            "side": side,
+            "price": price,
+            "qty": qty,
+            "order_id": order_id
+        }
+        
+        self._log_async(f"[{self.student_id}] FILL: {side} {qty} @ {price:.2f} | Inventory: {self.inventory} | PnL: {self.pnl:.2f}", block=True)
+    
+    def _handle_error(self, data: Dict, recv_ns: int):
+        """Report an order rejection or exchange error."""
+        print(f"[{self.student_id}] ERROR: {data.get('message')}")
+    
+    # =========================================================================
+    # PROGRESS OUTPUT
+    # =========================================================================
+    
+    def _log_async(self, line: str, block: bool = False):
+        """
+        Queue an output line for the printer thread.
+        
+        Progress lines are dropped if the queue is full; with block=True
+        (fills) wait up to a second for room first. With no printer running
+        nothing would drain the queue, so never wait: drop instead. Drops are
+        counted and reported in the final summary.
+        """
+        if not self._log_thread.is_alive():
+            self._log_dropped += 1
+            return
+        try:
+            self._log_q.put(line, block, 1.0)
+        except queue.Full:
+            self._log_dropped += 1
+    
+    def _log_drain(self):
+        """Print queued output lines (runs on a daemon thread)."""
+        while True:
+            line = self._log_q.get()
+            if line is None:  # shutdown sentinel from _flush_log
+                self._log_q.task_done()
+                return
+            try:
+                print(line)
+            except Exception:
+                self._log_dropped += 1  # broken pipe, encoding error: keep draining
+            finally:
+                self._log_q.task_done()
+    
+    def _flush_log(self, timeout: float = 2.0):
+        """Print what is still queued, waiting at most `timeout` seconds."""
+        if not self._log_thread.is_alive():
+            return
+        try:
+            self._log_q.put(None, timeout=timeout)
+        except queue.Full:
+            return  # printer is stuck or gone; don't hang shutdown
+        self._log_thread.join(timeout)
+    
     # =========================================================================
     # ERROR HANDLING
     # =========================================================================
@@ -533,7 +698,8 @@ class TradingBot:
         if not self.register():
             return
         
-        # Step 2: Connect
+        # Step 2: Connect (output printer first: callbacks start queueing lines)
+        self._log_thread.start()
         if not self.connect():
             return
         
@@ -551,6 +717,9 @@ class TradingBot:
             if self.order_ws:
                 self.order_ws.close()
             
+            # Flush queued output before the final summary
+            self._flush_log()
+            
             # Close logger
             if self.logger:
                 self.logger.close()
@@ -564,19 +733,21 @@ class TradingBot:
             print(f"  PnL: {self.pnl:.2f}")
             if log_path:
                 print(f"  Data logged to: {log_path}")
+            if self._log_dropped:
+                print(f"  Output lines dropped: {self._log_dropped}")
             
             # Print latency statistics
-            if self.step_latencies:
+            if self._step_latency_count:
                 print(f"\n  Step Latency (ms):")
-                print(f"    Min: {min(self.step_latencies):.1f}")
-                print(f"    Max: {max(self.step_latencies):.1f}")
-                print(f"    Avg: {sum(self.step_latencies)/len(self.step_latencies):.1f}")
+                print(f"    Min: {self._step_latency_min / 1e6:.1f}")
+                print(f"    Max: {self._step_latency_max / 1e6:.1f}")
+                print(f"    Avg: {self._step_latency_total / self._step_latency_count / 1e6:.1f}")
             
-            if self.fill_latencies:
+            if self._fill_latency_count:
                 print(f"\n  Fill Latency (ms):")
-                print(f"    Min: {min(self.fill_latencies):.1f}")
-                print(f"    Max: {max(self.fill_latencies):.1f}")
-                print(f"    Avg: {sum(self.fill_latencies)/len(self.fill_latencies):.1f}")
+                print(f"    Min: {self._fill_latency_min:.1f}")
+                print(f"    Max: {self._fill_latency_max:.1f}")
+                print(f"    Avg: {self._fill_latency_total / self._fill_latency_count:.1f}")
 
 
 # =============================================================================